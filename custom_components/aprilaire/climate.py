@@ -52,6 +52,11 @@ HVAC_MODE_MAP = {
     5: HVACMode.AUTO,
 }
 
+# Reverse lookup for setting the mode; HEAT maps to the first matching value
+HVAC_MODE_VALUE_MAP = {
+    hvac_mode: value for value, hvac_mode in reversed(HVAC_MODE_MAP.items())
+}
+
 HVAC_MODES_MAP = {
     1: [HVACMode.OFF, HVACMode.HEAT],
     2: [HVACMode.OFF, HVACMode.COOL],
@@ -74,6 +79,8 @@ FAN_MODE_MAP = {
     3: FAN_CIRCULATE,
 }
 
+FAN_MODE_VALUE_MAP = {fan_mode: value for value, fan_mode in FAN_MODE_MAP.items()}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -192,22 +199,14 @@ class AprilaireClimate(BaseAprilaireEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | str | None:
         """Get HVAC mode."""
-
-        if mode := self.coordinator.data.get(Attribute.MODE):
-            if hvac_mode := HVAC_MODE_MAP.get(mode):
-                return hvac_mode
-
-        return None
+        return HVAC_MODE_MAP.get(self.coordinator.data.get(Attribute.MODE))
 
     @property
     def hvac_modes(self) -> list[HVACMode] | list[str]:
         """Get supported HVAC modes."""
-
-        if modes := self.coordinator.data.get(Attribute.THERMOSTAT_MODES):
-            if thermostat_modes := HVAC_MODES_MAP.get(modes):
-                return thermostat_modes
-
-        return []
+        return HVAC_MODES_MAP.get(
+            self.coordinator.data.get(Attribute.THERMOSTAT_MODES), []
+        )
 
     @property
     def hvac_action(self) -> HVACAction | str | None:
@@ -272,11 +271,9 @@ class AprilaireClimate(BaseAprilaireEntity, ClimateEntity):
     @property
     def preset_mode(self) -> str | None:
         """Get the current preset mode."""
-        if hold := self.coordinator.data.get(Attribute.HOLD):
-            if preset_mode := PRESET_MODE_MAP.get(hold):
-                return preset_mode
-
-        return PRESET_NONE
+        return PRESET_MODE_MAP.get(
+            self.coordinator.data.get(Attribute.HOLD), PRESET_NONE
+        )
 
     @property
     def preset_modes(self) -> list[str] | None:
@@ -298,12 +295,7 @@ class AprilaireClimate(BaseAprilaireEntity, ClimateEntity):
     @property
     def fan_mode(self) -> str | None:
         """Get fan mode."""
-
-        if mode := self.coordinator.data.get(Attribute.FAN_MODE):
-            if fan_mode := FAN_MODE_MAP.get(mode):
-                return fan_mode
-
-        return None
+        return FAN_MODE_MAP.get(self.coordinator.data.get(Attribute.FAN_MODE))
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
@@ -379,12 +371,10 @@ class AprilaireClimate(BaseAprilaireEntity, ClimateEntity):
         """Set the fan mode."""
 
         try:
-            fan_mode_value_index = list(FAN_MODE_MAP.values()).index(fan_mode)
-        except ValueError as exc:
+            fan_mode_value = FAN_MODE_VALUE_MAP[fan_mode]
+        except KeyError as exc:
             raise ValueError(f"Unsupported fan mode {fan_mode}") from exc
 
-        fan_mode_value = list(FAN_MODE_MAP.keys())[fan_mode_value_index]
-
         await self.coordinator.client.update_fan_mode(fan_mode_value)
 
         await self.coordinator.client.read_control()
@@ -393,12 +383,10 @@ class AprilaireClimate(BaseAprilaireEntity, ClimateEntity):
         """Set the HVAC mode."""
 
         try:
-            mode_value_index = list(HVAC_MODE_MAP.values()).index(hvac_mode)
-        except ValueError as exc:
+            mode_value = HVAC_MODE_VALUE_MAP[hvac_mode]
+        except KeyError as exc:
             raise ValueError(f"Unsupported HVAC mode {hvac_mode}") from exc
 
-        mode_value = list(HVAC_MODE_MAP.keys())[mode_value_index]
-
         await self.coordinator.client.update_mode(mode_value)
 
         await self.coordinator.client.read_control()
@@ -18,6 +18,17 @@ from .const import DOMAIN
 RECONNECT_INTERVAL = 60 * 60
 RETRY_CONNECTION_INTERVAL = 10
 
+DEVICE_INFO_ATTRIBUTES = frozenset(
+    (
+        Attribute.MAC_ADDRESS,
+        Attribute.NAME,
+        Attribute.MODEL_NUMBER,
+        Attribute.HARDWARE_REVISION,
+        Attribute.FIRMWARE_MAJOR_REVISION,
+        Attribute.FIRMWARE_MINOR_REVISION,
+    )
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -44,20 +55,23 @@ class AprilaireCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def async_set_updated_data(self, data: Any) -> None:
         """Manually update data, notify listeners and reset refresh interval."""
 
-        old_device_info = self.create_device_info(self.data)
+        # Most packets carry no device info, so skip rebuilding it for them
+        if DEVICE_INFO_ATTRIBUTES.isdisjoint(data):
+            old_device_info = None
+        else:
+            old_device_info = self.create_device_info(self.data)
 
         if self.data is not None:
             data = self.data | data
 
         super().async_set_updated_data(data)
 
+        if old_device_info is None:
+            return
+
         new_device_info = self.create_device_info(data)
 
-        if (
-            old_device_info is not None
-            and new_device_info is not None
-            and old_device_info != new_device_info
-        ):
+        if new_device_info is not None and old_device_info != new_device_info:
             device_registry = dr.async_get(self.hass)
 
             device = device_registry.async_get_device(old_device_info["identifiers"])
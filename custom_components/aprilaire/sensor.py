@@ -65,7 +65,13 @@ async def async_setup_entry(
 
     coordinator: AprilaireCoordinator = hass.data[DOMAIN][config_entry.unique_id]
 
-    entities = []
+    async_add_entities(build_sensors(coordinator))
+
+
+def build_sensors(coordinator: AprilaireCoordinator) -> list[SensorEntity]:
+    """Build the sensors supported by the coordinator's data."""
+
+    entities: list[SensorEntity] = []
 
     if (
         coordinator.data.get(Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS, 3)
@@ -103,7 +109,7 @@ async def async_setup_entry(
     if coordinator.data.get(Attribute.AIR_CLEANING_AVAILABLE) == 1:
         entities.append(AprilaireAirCleaningStatusSensor(coordinator))
 
-    async_add_entities(entities)
+    return entities
 
 
 class BaseAprilaireHumiditySensor(SensorEntity):
@@ -312,18 +318,10 @@ class AprilaireDehumidificationStatusSensor(BaseAprilaireEntity, SensorEntity):
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-
-        dehumidification_status = self.coordinator.data.get(
-            Attribute.DEHUMIDIFICATION_STATUS
+        return DEHUMIDIFICATION_STATUS_MAP.get(
+            self.coordinator.data.get(Attribute.DEHUMIDIFICATION_STATUS)
         )
 
-        if dehumidification_status_value := DEHUMIDIFICATION_STATUS_MAP.get(
-            dehumidification_status
-        ):
-            return dehumidification_status_value
-
-        return None
-
 
 class AprilaireHumidificationStatusSensor(BaseAprilaireEntity, SensorEntity):
     """Sensor representing the current humidification status"""
@@ -341,18 +339,10 @@ class AprilaireHumidificationStatusSensor(BaseAprilaireEntity, SensorEntity):
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-
-        humidification_status = self.coordinator.data.get(
-            Attribute.HUMIDIFICATION_STATUS
+        return HUMIDIFICATION_STATUS_MAP.get(
+            self.coordinator.data.get(Attribute.HUMIDIFICATION_STATUS)
         )
 
-        if humidification_status_value := HUMIDIFICATION_STATUS_MAP.get(
-            humidification_status
-        ):
-            return humidification_status_value
-
-        return None
-
 
 class AprilaireVentilationStatusSensor(BaseAprilaireEntity, SensorEntity):
     """Sensor representing the current ventilation status"""
@@ -369,13 +359,9 @@ class AprilaireVentilationStatusSensor(BaseAprilaireEntity, SensorEntity):
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-
-        ventilation_status = self.coordinator.data.get(Attribute.VENTILATION_STATUS)
-
-        if ventilation_status_value := VENTILATION_STATUS_MAP.get(ventilation_status):
-            return ventilation_status_value
-
-        return None
+        return VENTILATION_STATUS_MAP.get(
+            self.coordinator.data.get(Attribute.VENTILATION_STATUS)
+        )
 
 
 class AprilaireAirCleaningStatusSensor(BaseAprilaireEntity, SensorEntity):
@@ -393,12 +379,6 @@ class AprilaireAirCleaningStatusSensor(BaseAprilaireEntity, SensorEntity):
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-
-        air_cleaning_status = self.coordinator.data.get(Attribute.AIR_CLEANING_STATUS)
-
-        if air_cleaning_status_value := AIR_CLEANING_STATUS_MAP.get(
-            air_cleaning_status
-        ):
-            return air_cleaning_status_value
-
-        return None
+        return AIR_CLEANING_STATUS_MAP.get(
+            self.coordinator.data.get(Attribute.AIR_CLEANING_STATUS)
+        )
@@ -1,11 +1,14 @@
 """Utililities for the Aprilaire integration."""
 
+from functools import lru_cache
 from math import ceil, floor
 
 from homeassistant.const import UnitOfTemperature
 from homeassistant.util.unit_conversion import TemperatureConverter
 
 
+# Temperatures arrive in half-degree steps, so the set of inputs is small
+@lru_cache(maxsize=256, typed=True)
 def convert_temperature_if_needed(
     temperature_unit: UnitOfTemperature, temperature: float
 ) -> float:
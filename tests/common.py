@@ -0,0 +1,114 @@
+"""Common helpers for Aprilaire tests."""
+
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+from pyaprilaire.const import Attribute
+
+
+def assert_calls(mock: Any, **expected: tuple | None) -> None:
+    """Assert the calls made on the named methods of a mock.
+
+    A tuple asserts the method was called once with those positional
+    arguments, and None asserts it was not called.
+    """
+
+    for name, args in expected.items():
+        method = getattr(mock, name)
+
+        if args is None:
+            method.assert_not_called()
+        else:
+            method.assert_called_once_with(*args)
+
+
+class FakeAprilaireClient:
+    """Lightweight stand-in for AprilaireClient.
+
+    Only the members used by the integration are provided, which avoids
+    building an autospec of the real client for every test. Method mocks are
+    created on first access, as AsyncMock instances are costly to build.
+    """
+
+    _ASYNC_METHODS = frozenset(
+        (
+            "start_listen",
+            "wait_for_response",
+            "read_control",
+            "read_scheduling",
+            "update_mode",
+            "update_setpoint",
+            "update_fan_mode",
+            "set_hold",
+            "set_humidification_setpoint",
+            "set_dehumidification_setpoint",
+            "set_air_cleaning",
+            "set_fresh_air",
+        )
+    )
+
+    def __init__(self) -> None:
+        self.connected = True
+        self.stopped = False
+        self.reconnecting = True
+        self.auto_reconnecting = True
+
+    def __getattr__(self, name: str):
+        if name in self._ASYNC_METHODS:
+            method = AsyncMock()
+        elif name == "stop_listen":
+            method = Mock()
+        else:
+            raise AttributeError(name)
+
+        setattr(self, name, method)
+
+        return method
+
+    def reset_mock(self) -> None:
+        """Reset the calls recorded on every method used so far."""
+        for value in vars(self).values():
+            if isinstance(value, Mock):
+                value.reset_mock()
+
+
+class FakeAprilaireCoordinator:
+    """Lightweight stand-in for AprilaireCoordinator.
+
+    Entities only read the coordinator's data, client and device info, and
+    register a listener when added to Home Assistant.
+    """
+
+    def __init__(self, client: Any, logger: Any) -> None:
+        self.data: dict[str, Any] = {Attribute.MAC_ADDRESS: "1:2:3:4:5:6"}
+        self.client = client
+        self.logger = logger
+        self.device_info = None
+
+    def async_add_listener(self, update_callback: Any, context: Any = None):
+        """Register a listener, returning a no-op removal callback."""
+        return lambda: None
+
+
+class FakeAddEntities:
+    """Lightweight stand-in for a platform's add entities callback.
+
+    Records the entity lists it is called with, without the call tracking
+    machinery of a Mock.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[list[Any]] = []
+
+    def __call__(self, new_entities: Any, update_before_add: bool = False) -> None:
+        self.calls.append(list(new_entities))
+
+    def entities(self) -> list[Any]:
+        """Get the entities passed on the first call."""
+        return self.calls[0]
+
+    def first_entity(self) -> Any:
+        """Get the first entity passed on the first call."""
+        return self.calls[0][0]
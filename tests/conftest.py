@@ -2,27 +2,41 @@
 
 # pylint: disable=redefined-outer-name
 
+import asyncio
 import logging
+from collections.abc import Iterator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import Config, EventBus, HomeAssistant
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceRegistry
-from homeassistant.util import uuid as uuid_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 from pyaprilaire.client import AprilaireClient
-from pyaprilaire.const import Attribute
 
 from custom_components.aprilaire.const import DOMAIN
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 
+from .common import FakeAddEntities, FakeAprilaireClient, FakeAprilaireCoordinator
 
-@pytest.fixture
+UNIQUE_ID = "test-unique-id"
+
+
+@pytest.fixture(scope="module")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Share one event loop across the async tests in each module."""
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
 def logger():
     """Get a logger instance."""
-    logger_instance = logging.getLogger()
+    logger_instance = logging.getLogger("aprilaire_test")
     logger_instance.propagate = False
 
     return logger_instance
@@ -31,13 +45,7 @@ def logger():
 @pytest.fixture
 def client() -> AprilaireClient:
     """Get a client instance."""
-    client_mock = AsyncMock(AprilaireClient)
-    client_mock.connected = True
-    client_mock.stopped = False
-    client_mock.reconnecting = True
-    client_mock.auto_reconnecting = True
-
-    return client_mock
+    return FakeAprilaireClient()
 
 
 @pytest.fixture
@@ -45,49 +53,54 @@ def coordinator(
     client: AprilaireClient, logger: logging.Logger
 ) -> AprilaireCoordinator:
     """Get a coordinator instance."""
-    coordinator_mock = AsyncMock(AprilaireCoordinator)
-    coordinator_mock.data = {Attribute.MAC_ADDRESS: "1:2:3:4:5:6"}
-    coordinator_mock.client = client
-    coordinator_mock.logger = logger
-
-    return coordinator_mock
+    return FakeAprilaireCoordinator(client, logger)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unique_id() -> str:
-    """Get a unique ID."""
-    return uuid_util.random_uuid_hex()
+    """Get the config entry's unique ID."""
+    return UNIQUE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_registry() -> DeviceRegistry:
-    """Return a mock device registry."""
+    """Return a mock device registry, built once per session."""
     return Mock(DeviceRegistry)
 
 
+@pytest.fixture(autouse=True)
+def _reset_device_registry(device_registry: DeviceRegistry) -> None:
+    """Clear calls and configured results on the shared device registry."""
+    device_registry.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def hass(
     coordinator: AprilaireCoordinator, device_registry: DeviceRegistry, unique_id: str
 ) -> HomeAssistant:
     """Get a HomeAssistant instance."""
-    hass_mock = AsyncMock(HomeAssistant)
-    hass_mock.data = {
-        DOMAIN: {unique_id: coordinator},
-        "device_registry": device_registry,
-    }
-    hass_mock.config_entries = AsyncMock(ConfigEntries)
-    hass_mock.bus = AsyncMock(EventBus)
-    hass_mock.config = Mock(Config)
-    hass_mock.config.units = METRIC_SYSTEM
-
-    return hass_mock
+    return SimpleNamespace(
+        data={
+            DOMAIN: {unique_id: coordinator},
+            "device_registry": device_registry,
+        },
+        config_entries=AsyncMock(),
+        bus=Mock(),
+        config=SimpleNamespace(units=METRIC_SYSTEM),
+    )
 
 
 @pytest.fixture
 def config_entry(unique_id: str) -> ConfigEntry:
     """Get a config entry instance."""
-    config_entry_mock = AsyncMock(ConfigEntry)
-    config_entry_mock.data = {CONF_HOST: "test123", CONF_PORT: 123}
-    config_entry_mock.unique_id = unique_id
+    return SimpleNamespace(
+        data={CONF_HOST: "test123", CONF_PORT: 123},
+        unique_id=unique_id,
+        async_on_unload=Mock(),
+    )
+
 
-    return config_entry_mock
+@pytest.fixture
+def add_entities() -> FakeAddEntities:
+    """Get an add entities callback that records the entities it is given."""
+    return FakeAddEntities()
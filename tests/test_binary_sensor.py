@@ -15,10 +15,15 @@ from custom_components.aprilaire.binary_sensor import (
 )
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 
+from .common import FakeAddEntities
+
 
 @pytest.fixture
 async def fan_status_sensor(
-    config_entry: ConfigEntry, coordinator: AprilaireCoordinator, hass: HomeAssistant
+    add_entities: FakeAddEntities,
+    config_entry: ConfigEntry,
+    coordinator: AprilaireCoordinator,
+    hass: HomeAssistant,
 ) -> AprilaireFanStatusSensor:
     """Get a fan status sensor instance."""
 
@@ -26,18 +31,15 @@ async def fan_status_sensor(
         Attribute.FAN_STATUS: 0,
     }
 
-    async_add_entities_mock = Mock()
     async_get_current_platform_mock = Mock()
 
     with patch(
         "homeassistant.helpers.entity_platform.async_get_current_platform",
         new=async_get_current_platform_mock,
     ):
-        await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    binary_sensors_list = async_add_entities_mock.call_args_list[0][0]
+        await async_setup_entry(hass, config_entry, add_entities)
 
-    binary_sensor = binary_sensors_list[0][0]
+    binary_sensor = add_entities.first_entity()
     binary_sensor._attr_available = True
     binary_sensor.hass = hass
 
@@ -2,7 +2,9 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
-from unittest.mock import Mock, PropertyMock, patch
+from collections.abc import Mapping
+from types import MappingProxyType
+from unittest.mock import Mock, patch
 
 import pytest
 from homeassistant.components.climate import (
@@ -32,27 +34,48 @@ from custom_components.aprilaire.climate import (
 )
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 
+from .common import FakeAddEntities, assert_calls
+
+# Shared, read-only empty coordinator data for the parametrized "unset" cases
+_NO_DATA = MappingProxyType({})
+
 
 @pytest.fixture
-async def climate(config_entry: ConfigEntry, hass: HomeAssistant) -> AprilaireClimate:
+def climate(coordinator: AprilaireCoordinator, hass: HomeAssistant) -> AprilaireClimate:
     """Get a climate entity."""
 
-    async_add_entities_mock = Mock()
+    climate = AprilaireClimate(coordinator)
+    climate._attr_available = True
+    climate.hass = hass
+
+    return climate
+
+
+async def test_async_setup_entry(
+    add_entities: FakeAddEntities,
+    config_entry: ConfigEntry,
+    coordinator: AprilaireCoordinator,
+    hass: HomeAssistant,
+):
+    """Test that the climate entity and its services are set up."""
+
     async_get_current_platform_mock = Mock()
 
     with patch(
         "homeassistant.helpers.entity_platform.async_get_current_platform",
         new=async_get_current_platform_mock,
     ):
-        await async_setup_entry(hass, config_entry, async_add_entities_mock)
+        await async_setup_entry(hass, config_entry, add_entities)
 
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
+    climates_list = add_entities.entities()
 
-    climate = sensors_list[0][0]
-    climate._attr_available = True
-    climate.hass = hass
+    assert len(climates_list) == 1
+    assert isinstance(climates_list[0], AprilaireClimate)
+    assert climates_list[0].coordinator is coordinator
 
-    return climate
+    platform = async_get_current_platform_mock.return_value
+
+    assert platform.async_register_entity_service.call_count == 9
 
 
 def test_climate_min_temp(climate: AprilaireClimate):
@@ -70,162 +93,119 @@ def test_climate_fan_modes(climate: AprilaireClimate):
     assert climate.fan_modes == [FAN_AUTO, FAN_ON, FAN_CIRCULATE]
 
 
-def test_climate_fan_mode(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
-    """Test the climate current fan mode."""
-
-    assert climate.fan_mode is None
-
-    coordinator.data = {
-        Attribute.FAN_MODE: 0,
-    }
-
-    assert climate.fan_mode is None
-
-    coordinator.data = {
-        Attribute.FAN_MODE: 1,
-    }
-
-    assert climate.fan_mode == FAN_ON
-
-    coordinator.data = {
-        Attribute.FAN_MODE: 2,
-    }
-
-    assert climate.fan_mode == FAN_AUTO
-
-    coordinator.data = {
-        Attribute.FAN_MODE: 3,
-    }
-
-    assert climate.fan_mode == FAN_CIRCULATE
-
-
-def test_supported_features_no_mode(climate: AprilaireClimate):
-    """Test the climate entity supported features when there is no mode set."""
-
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
-
-
-def test_supported_features_mode_4(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
-):
-    """Test the climate entity supported features when mode is 4."""
-
-    coordinator.data = {
-        Attribute.MODE: 4,
-    }
-
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
-
-
-def test_supported_features_mode_5(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
-):
-    """Test the climate entity supported features when mode is 5."""
-
-    coordinator.data = {
-        Attribute.MODE: 5,
-    }
-
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
-
-
-def test_supported_features_humidification_available(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
-):
-    """Test the climate entity supported features when humidification is available."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_AVAILABLE: 2,
-    }
-
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.TARGET_HUMIDITY
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
-
-
-def test_supported_features_dehumidification_available(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
-):
-    """Test the climate entity supported features when dehumidification is available."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_AVAILABLE: 1,
-    }
-
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
-
-
-def test_supported_features_air_cleaning_available(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, None),
+        ({Attribute.FAN_MODE: 0}, None),
+        ({Attribute.FAN_MODE: 1}, FAN_ON),
+        ({Attribute.FAN_MODE: 2}, FAN_AUTO),
+        ({Attribute.FAN_MODE: 3}, FAN_CIRCULATE),
+    ],
+    ids=["unset", "0", "on", "auto", "circulate"],
+)
+def test_climate_fan_mode(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: str | None,
 ):
-    """Test the climate entity supported features when air cleaning is available."""
+    """Test the climate current fan mode."""
 
-    coordinator.data = {
-        Attribute.AIR_CLEANING_AVAILABLE: 1,
-    }
+    coordinator.data = data
 
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
+    assert climate.fan_mode == expected
 
 
-def test_supported_features_ventilation_available(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (
+            _NO_DATA,
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.MODE: 4},
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.MODE: 5},
+            ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.HUMIDIFICATION_AVAILABLE: 2},
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.TARGET_HUMIDITY
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.DEHUMIDIFICATION_AVAILABLE: 1},
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.AIR_CLEANING_AVAILABLE: 1},
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+        (
+            {Attribute.VENTILATION_AVAILABLE: 1},
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.PRESET_MODE
+            | ClimateEntityFeature.FAN_MODE,
+        ),
+    ],
+    ids=[
+        "no_mode",
+        "mode_4",
+        "mode_5",
+        "humidification_available",
+        "dehumidification_available",
+        "air_cleaning_available",
+        "ventilation_available",
+    ],
+)
+def test_supported_features(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: ClimateEntityFeature,
 ):
-    """Test the climate entity supported features when ventilation is available."""
+    """Test the climate entity supported features."""
 
-    coordinator.data = {
-        Attribute.VENTILATION_AVAILABLE: 1,
-    }
+    coordinator.data = data
 
-    assert (
-        climate.supported_features
-        == ClimateEntityFeature.TARGET_TEMPERATURE
-        | ClimateEntityFeature.PRESET_MODE
-        | ClimateEntityFeature.FAN_MODE
-    )
+    assert climate.supported_features == expected
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, None),
+        ({Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: 20}, 20),
+    ],
+    ids=["unset", "set"],
+)
 def test_current_temperature(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: float | None,
 ):
     """Test the climate entity current temperature."""
 
-    assert climate.current_temperature is None
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: 20,
-    }
-
-    assert climate.current_temperature == 20
+    assert climate.current_temperature == expected
 
 
 def test_corrected_current_temperature(
@@ -242,76 +222,82 @@ def test_corrected_current_temperature(
     assert climate.current_temperature > 22.5
 
 
-def test_current_humidity(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [(_NO_DATA, None), ({Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE: 20}, 20)],
+    ids=["unset", "set"],
+)
+def test_current_humidity(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: float | None,
+):
     """Test the climate entity current humidity."""
 
-    assert climate.current_humidity is None
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE: 20,
-    }
-
-    assert climate.current_humidity == 20
+    assert climate.current_humidity == expected
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [(_NO_DATA, None), ({Attribute.HEAT_SETPOINT: 20}, 20)],
+    ids=["unset", "set"],
+)
 def test_target_temperature_low(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: float | None,
 ):
     """Test the climate entity target low temperature."""
 
-    assert climate.target_temperature_low is None
-
-    coordinator.data = {
-        Attribute.HEAT_SETPOINT: 20,
-    }
+    coordinator.data = data
 
-    assert climate.target_temperature_low == 20
+    assert climate.target_temperature_low == expected
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [(_NO_DATA, None), ({Attribute.COOL_SETPOINT: 20}, 20)],
+    ids=["unset", "set"],
+)
 def test_target_temperature_high(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: float | None,
 ):
     """Test the climate entity target high temperature."""
 
-    assert climate.target_temperature_high is None
-
-    coordinator.data = {
-        Attribute.COOL_SETPOINT: 20,
-    }
+    coordinator.data = data
 
-    assert climate.target_temperature_high == 20
+    assert climate.target_temperature_high == expected
 
 
-def test_target_temperature(climate: AprilaireClimate):
+@pytest.mark.parametrize(
+    "hvac_mode,expected",
+    [(HVACMode.OFF, None), (HVACMode.COOL, 25), (HVACMode.HEAT, 20)],
+    ids=["off", "cool", "heat"],
+)
+def test_target_temperature(
+    climate: AprilaireClimate,
+    monkeypatch: pytest.MonkeyPatch,
+    hvac_mode: HVACMode,
+    expected: int | None,
+):
     """Test the climate entity target temperature."""
 
-    target_temperature_low_mock = PropertyMock(return_value=20)
-    target_temperature_high_mock = PropertyMock(return_value=25)
-    hvac_mode_mock = PropertyMock(return_value=HVACMode.OFF)
-
-    with (
-        patch(
-            "custom_components.aprilaire.climate.AprilaireClimate.target_temperature_low",
-            new=target_temperature_low_mock,
-        ),
-        patch(
-            "custom_components.aprilaire.climate.AprilaireClimate.target_temperature_high",
-            new=target_temperature_high_mock,
-        ),
-        patch(
-            "custom_components.aprilaire.climate.AprilaireClimate.hvac_mode",
-            new=hvac_mode_mock,
-        ),
-    ):
-        assert climate.target_temperature is None
-
-        hvac_mode_mock.return_value = HVACMode.COOL
-
-        assert climate.target_temperature == 25
-
-        hvac_mode_mock.return_value = HVACMode.HEAT
+    monkeypatch.setattr(
+        AprilaireClimate, "target_temperature_low", property(lambda self: 20)
+    )
+    monkeypatch.setattr(
+        AprilaireClimate, "target_temperature_high", property(lambda self: 25)
+    )
+    monkeypatch.setattr(AprilaireClimate, "hvac_mode", property(lambda self: hvac_mode))
 
-        assert climate.target_temperature == 20
+    assert climate.target_temperature == expected
 
 
 def test_target_temperature_step(climate: AprilaireClimate):
@@ -334,236 +320,207 @@ def test_precision(climate: AprilaireClimate):
     assert climate.precision == 1
 
 
-def test_hvac_mode(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, None),
+        ({Attribute.MODE: 0}, None),
+        ({Attribute.MODE: 1}, HVACMode.OFF),
+        ({Attribute.MODE: 2}, HVACMode.HEAT),
+        ({Attribute.MODE: 3}, HVACMode.COOL),
+        ({Attribute.MODE: 4}, HVACMode.HEAT),
+        ({Attribute.MODE: 5}, HVACMode.AUTO),
+    ],
+    ids=["unset", "0", "1", "2", "3", "4", "5"],
+)
+def test_hvac_mode(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: HVACMode | None,
+):
     """Test the climate entity HVAC mode."""
 
-    assert climate.hvac_mode is None
-
-    coordinator.data = {
-        Attribute.MODE: 0,
-    }
-
-    assert climate.hvac_mode is None
-
-    coordinator.data = {
-        Attribute.MODE: 1,
-    }
+    coordinator.data = data
 
-    assert climate.hvac_mode == HVACMode.OFF
+    assert climate.hvac_mode == expected
 
-    coordinator.data = {
-        Attribute.MODE: 2,
-    }
-
-    assert climate.hvac_mode == HVACMode.HEAT
-
-    coordinator.data = {
-        Attribute.MODE: 3,
-    }
-
-    assert climate.hvac_mode == HVACMode.COOL
-
-    coordinator.data = {
-        Attribute.MODE: 4,
-    }
 
-    assert climate.hvac_mode == HVACMode.HEAT
-
-    coordinator.data = {
-        Attribute.MODE: 5,
-    }
-
-    assert climate.hvac_mode == HVACMode.AUTO
-
-
-def test_hvac_modes(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, []),
+        ({Attribute.THERMOSTAT_MODES: 0}, []),
+        ({Attribute.THERMOSTAT_MODES: 1}, [HVACMode.OFF, HVACMode.HEAT]),
+        ({Attribute.THERMOSTAT_MODES: 2}, [HVACMode.OFF, HVACMode.COOL]),
+        (
+            {Attribute.THERMOSTAT_MODES: 3},
+            [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL],
+        ),
+        (
+            {Attribute.THERMOSTAT_MODES: 4},
+            [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL],
+        ),
+        (
+            {Attribute.THERMOSTAT_MODES: 5},
+            [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO],
+        ),
+        (
+            {Attribute.THERMOSTAT_MODES: 6},
+            [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO],
+        ),
+    ],
+    ids=["unset", "0", "1", "2", "3", "4", "5", "6"],
+)
+def test_hvac_modes(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: list[HVACMode],
+):
     """Test the climate entity HVAC modes."""
 
-    assert climate.hvac_modes == []
-
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 0,
-    }
-
-    assert climate.hvac_modes == []
-
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 1,
-    }
-
-    assert climate.hvac_modes, [HVACMode.OFF == HVACMode.HEAT]
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 2,
-    }
-
-    assert climate.hvac_modes, [HVACMode.OFF == HVACMode.COOL]
-
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 3,
-    }
+    assert climate.hvac_modes == expected
 
-    assert climate.hvac_modes, [HVACMode.OFF, HVACMode.HEAT == HVACMode.COOL]
 
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 4,
-    }
-
-    assert climate.hvac_modes, [HVACMode.OFF, HVACMode.HEAT == HVACMode.COOL]
-
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 5,
-    }
-
-    assert climate.hvac_modes == [
-        HVACMode.OFF,
-        HVACMode.HEAT,
-        HVACMode.COOL,
-        HVACMode.AUTO,
-    ]
-
-    coordinator.data = {
-        Attribute.THERMOSTAT_MODES: 6,
-    }
-
-    assert climate.hvac_modes == [
-        HVACMode.OFF,
-        HVACMode.HEAT,
-        HVACMode.COOL,
-        HVACMode.AUTO,
-    ]
-
-
-def test_hvac_action(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, HVACAction.IDLE),
+        (
+            {
+                Attribute.HEATING_EQUIPMENT_STATUS: 0,
+                Attribute.COOLING_EQUIPMENT_STATUS: 0,
+            },
+            HVACAction.IDLE,
+        ),
+        (
+            {
+                Attribute.HEATING_EQUIPMENT_STATUS: 1,
+                Attribute.COOLING_EQUIPMENT_STATUS: 0,
+            },
+            HVACAction.HEATING,
+        ),
+        (
+            {
+                Attribute.HEATING_EQUIPMENT_STATUS: 1,
+                Attribute.COOLING_EQUIPMENT_STATUS: 1,
+            },
+            HVACAction.HEATING,
+        ),
+        (
+            {
+                Attribute.HEATING_EQUIPMENT_STATUS: 0,
+                Attribute.COOLING_EQUIPMENT_STATUS: 1,
+            },
+            HVACAction.COOLING,
+        ),
+    ],
+    ids=["unset", "idle", "heating", "heating_and_cooling", "cooling"],
+)
+def test_hvac_action(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: HVACAction,
+):
     """Test the climate entity HVAC action."""
 
-    assert climate.hvac_action == HVACAction.IDLE
-
-    coordinator.data = {
-        Attribute.HEATING_EQUIPMENT_STATUS: 0,
-        Attribute.COOLING_EQUIPMENT_STATUS: 0,
-    }
-
-    assert climate.hvac_action == HVACAction.IDLE
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.HEATING_EQUIPMENT_STATUS: 1,
-        Attribute.COOLING_EQUIPMENT_STATUS: 0,
-    }
+    assert climate.hvac_action == expected
 
-    assert climate.hvac_action == HVACAction.HEATING
 
-    coordinator.data = {
-        Attribute.HEATING_EQUIPMENT_STATUS: 1,
-        Attribute.COOLING_EQUIPMENT_STATUS: 1,
-    }
-
-    assert climate.hvac_action == HVACAction.HEATING
-
-    coordinator.data = {
-        Attribute.HEATING_EQUIPMENT_STATUS: 0,
-        Attribute.COOLING_EQUIPMENT_STATUS: 1,
-    }
-
-    assert climate.hvac_action == HVACAction.COOLING
-
-
-def test_preset_modes(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, [PRESET_NONE, PRESET_VACATION]),
+        (
+            {Attribute.AWAY_AVAILABLE: 1},
+            [PRESET_NONE, PRESET_VACATION, PRESET_AWAY],
+        ),
+        (
+            {Attribute.HOLD: 1},
+            [PRESET_NONE, PRESET_VACATION, PRESET_TEMPORARY_HOLD],
+        ),
+        (
+            {Attribute.HOLD: 2},
+            [PRESET_NONE, PRESET_VACATION, PRESET_PERMANENT_HOLD],
+        ),
+        (
+            {Attribute.HOLD: 1, Attribute.AWAY_AVAILABLE: 1},
+            [PRESET_NONE, PRESET_VACATION, PRESET_AWAY, PRESET_TEMPORARY_HOLD],
+        ),
+        (
+            {Attribute.HOLD: 2, Attribute.AWAY_AVAILABLE: 1},
+            [PRESET_NONE, PRESET_VACATION, PRESET_AWAY, PRESET_PERMANENT_HOLD],
+        ),
+    ],
+    ids=[
+        "default",
+        "away_available",
+        "temporary_hold",
+        "permanent_hold",
+        "away_available_temporary_hold",
+        "away_available_permanent_hold",
+    ],
+)
+def test_preset_modes(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: list[str],
+):
     """Test the climate entity preset modes."""
 
-    assert climate.preset_modes, [PRESET_NONE == PRESET_VACATION]
-
-    coordinator.data = {
-        Attribute.AWAY_AVAILABLE: 1,
-    }
-
-    assert climate.preset_modes, [PRESET_NONE, PRESET_VACATION == PRESET_AWAY]
-
-    coordinator.data = {
-        Attribute.HOLD: 1,
-    }
+    coordinator.data = data
 
-    assert climate.preset_modes == [PRESET_NONE, PRESET_VACATION, PRESET_TEMPORARY_HOLD]
-
-    coordinator.data = {
-        Attribute.HOLD: 2,
-    }
-
-    assert climate.preset_modes == [PRESET_NONE, PRESET_VACATION, PRESET_PERMANENT_HOLD]
-
-    coordinator.data = {
-        Attribute.HOLD: 1,
-        Attribute.AWAY_AVAILABLE: 1,
-    }
-
-    assert climate.preset_modes == [
-        PRESET_NONE,
-        PRESET_VACATION,
-        PRESET_AWAY,
-        PRESET_TEMPORARY_HOLD,
-    ]
-
-    coordinator.data = {
-        Attribute.HOLD: 2,
-        Attribute.AWAY_AVAILABLE: 1,
-    }
+    assert climate.preset_modes == expected
 
-    assert climate.preset_modes == [
-        PRESET_NONE,
-        PRESET_VACATION,
-        PRESET_AWAY,
-        PRESET_PERMANENT_HOLD,
-    ]
 
-
-def test_preset_mode(climate: AprilaireClimate, coordinator: AprilaireCoordinator):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (_NO_DATA, PRESET_NONE),
+        ({Attribute.HOLD: 0}, PRESET_NONE),
+        ({Attribute.HOLD: 1}, PRESET_TEMPORARY_HOLD),
+        ({Attribute.HOLD: 2}, PRESET_PERMANENT_HOLD),
+        ({Attribute.HOLD: 3}, PRESET_AWAY),
+        ({Attribute.HOLD: 4}, PRESET_VACATION),
+    ],
+    ids=["unset", "none", "temporary", "permanent", "away", "vacation"],
+)
+def test_preset_mode(
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: str,
+):
     """Test the climate entity current preset mode."""
 
-    assert climate.preset_mode == PRESET_NONE
-
-    coordinator.data = {
-        Attribute.HOLD: 0,
-    }
-
-    assert climate.preset_mode == PRESET_NONE
-
-    coordinator.data = {
-        Attribute.HOLD: 1,
-    }
-
-    assert climate.preset_mode == PRESET_TEMPORARY_HOLD
-
-    coordinator.data = {
-        Attribute.HOLD: 2,
-    }
-
-    assert climate.preset_mode == PRESET_PERMANENT_HOLD
-
-    coordinator.data = {
-        Attribute.HOLD: 3,
-    }
-
-    assert climate.preset_mode == PRESET_AWAY
-
-    coordinator.data = {
-        Attribute.HOLD: 4,
-    }
+    coordinator.data = data
 
-    assert climate.preset_mode == PRESET_VACATION
+    assert climate.preset_mode == expected
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [(_NO_DATA, None), ({Attribute.HUMIDIFICATION_SETPOINT: 20}, 20)],
+    ids=["unset", "set"],
+)
 def test_climate_target_humidity(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: float | None,
 ):
     """Test the climate entity target humidity."""
 
-    assert climate.target_humidity is None
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_SETPOINT: 10,
-    }
-
-    assert climate.target_humidity == 10
+    assert climate.target_humidity == expected
 
 
 def test_climate_min_humidity(climate: AprilaireClimate):
@@ -578,204 +535,175 @@ def test_climate_max_humidity(climate: AprilaireClimate):
     assert climate.max_humidity == 50
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [({Attribute.FAN_STATUS: 0}, "off"), ({Attribute.FAN_STATUS: 1}, "on")],
+    ids=["off", "on"],
+)
 def test_climate_extra_state_attributes(
-    climate: AprilaireClimate, coordinator: AprilaireCoordinator
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+    data: Mapping,
+    expected: str,
 ):
     """Test the climate entity extra state attributes."""
 
-    coordinator.data = {
-        Attribute.FAN_STATUS: 0,
-    }
-
-    assert climate.extra_state_attributes.get(Attribute.FAN_STATUS) == "off"
+    coordinator.data = data
 
-    coordinator.data = {
-        Attribute.FAN_STATUS: 1,
-    }
-
-    assert climate.extra_state_attributes.get(Attribute.FAN_STATUS) == "on"
+    assert climate.extra_state_attributes.get(Attribute.FAN_STATUS) == expected
 
 
+@pytest.mark.parametrize(
+    "hvac_mode,expected_mode",
+    [
+        (HVACMode.OFF, 1),
+        (HVACMode.HEAT, 2),
+        (HVACMode.COOL, 3),
+        (HVACMode.AUTO, 5),
+    ],
+    ids=["off", "heat", "cool", "auto"],
+)
 async def test_set_hvac_mode(
     client: AprilaireClient,
     climate: AprilaireClimate,
+    hvac_mode: HVACMode,
+    expected_mode: int,
 ):
     """Test setting the climate entity HVAC mode."""
 
-    await climate.async_set_hvac_mode(HVACMode.OFF)
-
-    client.update_mode.assert_called_once_with(1)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_hvac_mode(HVACMode.HEAT)
+    await climate.async_set_hvac_mode(hvac_mode)
 
-    client.update_mode.assert_called_once_with(2)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_hvac_mode(HVACMode.COOL)
-
-    client.update_mode.assert_called_once_with(3)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_hvac_mode(HVACMode.AUTO)
-
-    client.update_mode.assert_called_once_with(5)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    with pytest.raises(ValueError):
-        await climate.async_set_hvac_mode(HVACMode.HEAT_COOL)
+    assert_calls(client, update_mode=(expected_mode,), read_control=())
 
-    client.update_mode.assert_not_called()
-    client.read_control.assert_not_called()
-    client.reset_mock()
-
-    with pytest.raises(ValueError):
-        await climate.async_set_hvac_mode(HVACMode.DRY)
 
-    client.update_mode.assert_not_called()
-    client.read_control.assert_not_called()
-    client.reset_mock()
+@pytest.mark.parametrize(
+    "hvac_mode",
+    [HVACMode.HEAT_COOL, HVACMode.DRY, HVACMode.FAN_ONLY],
+    ids=["heat_cool", "dry", "fan_only"],
+)
+async def test_set_invalid_hvac_mode(
+    client: AprilaireClient,
+    climate: AprilaireClimate,
+    hvac_mode: HVACMode,
+):
+    """Test setting an unsupported climate entity HVAC mode."""
 
     with pytest.raises(ValueError):
-        await climate.async_set_hvac_mode(HVACMode.FAN_ONLY)
+        await climate.async_set_hvac_mode(hvac_mode)
 
-    client.update_mode.assert_not_called()
-    client.read_control.assert_not_called()
-    client.reset_mock()
+    assert_calls(client, update_mode=None, read_control=None)
 
 
+@pytest.mark.parametrize(
+    "mode,kwargs,expected_setpoint",
+    [
+        (1, {"temperature": 20}, (0, 20)),
+        (3, {"temperature": 20}, (20, 0)),
+        (3, {"target_temp_low": 20}, (0, 20)),
+        (3, {"target_temp_high": 20}, (20, 0)),
+        (3, {"target_temp_low": 20, "target_temp_high": 30}, (30, 20)),
+    ],
+    ids=["heat", "cool", "low", "high", "range"],
+)
 async def test_set_temperature(
     client: AprilaireClient,
     climate: AprilaireClimate,
     coordinator: AprilaireCoordinator,
+    mode: int,
+    kwargs: dict,
+    expected_setpoint: tuple[float, float],
 ):
     """Test setting the climate entity temperature."""
 
     coordinator.data = {
-        Attribute.MODE: 1,
+        Attribute.MODE: mode,
     }
 
-    await climate.async_set_temperature(temperature=20)
+    await climate.async_set_temperature(**kwargs)
+
+    assert_calls(client, update_setpoint=expected_setpoint, read_control=())
 
-    client.update_setpoint.assert_called_once_with(0, 20)
-    client.read_control.assert_called_once()
-    client.reset_mock()
+
+async def test_set_no_temperature(
+    client: AprilaireClient,
+    climate: AprilaireClimate,
+    coordinator: AprilaireCoordinator,
+):
+    """Test setting the climate entity temperature without a value."""
 
     coordinator.data = {
         Attribute.MODE: 3,
     }
 
-    await climate.async_set_temperature(temperature=20)
-
-    client.update_setpoint.assert_called_once_with(20, 0)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_temperature(target_temp_low=20)
-
-    client.update_setpoint.assert_called_once_with(0, 20)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_temperature(target_temp_high=20)
-
-    client.update_setpoint.assert_called_once_with(20, 0)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_temperature(target_temp_low=20, target_temp_high=30)
-
-    client.update_setpoint.assert_called_once_with(30, 20)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
     await climate.async_set_temperature()
 
-    client.update_setpoint.assert_not_called()
-    client.read_control.assert_not_called()
-    client.reset_mock()
+    assert_calls(client, update_setpoint=None, read_control=None)
 
 
+@pytest.mark.parametrize(
+    "fan_mode,expected_fan_mode",
+    [(FAN_ON, 1), (FAN_AUTO, 2), (FAN_CIRCULATE, 3)],
+    ids=["on", "auto", "circulate"],
+)
 async def test_set_fan_mode(
     client: AprilaireClient,
     climate: AprilaireClimate,
+    fan_mode: str,
+    expected_fan_mode: int,
 ):
     """Test setting the climate entity fan mode."""
 
-    await climate.async_set_fan_mode(FAN_ON)
+    await climate.async_set_fan_mode(fan_mode)
 
-    client.update_fan_mode.assert_called_once_with(1)
-    client.read_control.assert_called_once()
-    client.reset_mock()
+    assert_calls(client, update_fan_mode=(expected_fan_mode,), read_control=())
 
-    await climate.async_set_fan_mode(FAN_AUTO)
 
-    client.update_fan_mode.assert_called_once_with(2)
-    client.read_control.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_fan_mode(FAN_CIRCULATE)
-
-    client.update_fan_mode.assert_called_once_with(3)
-    client.read_control.assert_called_once()
-    client.reset_mock()
+async def test_set_invalid_fan_mode(
+    client: AprilaireClient,
+    climate: AprilaireClimate,
+):
+    """Test setting an unsupported climate entity fan mode."""
 
     with pytest.raises(ValueError):
         await climate.async_set_fan_mode("")
 
-    client.update_fan_mode.assert_not_called()
-    client.read_control.assert_not_called()
-    client.reset_mock()
+    assert_calls(client, update_fan_mode=None, read_control=None)
 
 
+@pytest.mark.parametrize(
+    "preset_mode,expected_hold",
+    [(PRESET_AWAY, 3), (PRESET_VACATION, 4), (PRESET_NONE, 0)],
+    ids=["away", "vacation", "none"],
+)
 async def test_set_preset_mode(
     client: AprilaireClient,
     climate: AprilaireClimate,
+    preset_mode: str,
+    expected_hold: int,
 ):
     """Test setting the climate entity preset mode."""
 
-    await climate.async_set_preset_mode(PRESET_AWAY)
-
-    client.set_hold.assert_called_once_with(3)
-    client.read_scheduling.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_preset_mode(PRESET_VACATION)
-
-    client.set_hold.assert_called_once_with(4)
-    client.read_scheduling.assert_called_once()
-    client.reset_mock()
-
-    await climate.async_set_preset_mode(PRESET_NONE)
-
-    client.set_hold.assert_called_once_with(0)
-    client.read_scheduling.assert_called_once()
-    client.reset_mock()
-
-    with pytest.raises(ValueError):
-        await climate.async_set_preset_mode(PRESET_TEMPORARY_HOLD)
+    await climate.async_set_preset_mode(preset_mode)
 
-    client.set_hold.assert_not_called()
-    client.read_scheduling.assert_not_called()
-    client.reset_mock()
+    assert_calls(client, set_hold=(expected_hold,), read_scheduling=())
 
-    with pytest.raises(ValueError):
-        await climate.async_set_preset_mode(PRESET_PERMANENT_HOLD)
 
-    client.set_hold.assert_not_called()
-    client.read_scheduling.assert_not_called()
-    client.reset_mock()
+@pytest.mark.parametrize(
+    "preset_mode",
+    [PRESET_TEMPORARY_HOLD, PRESET_PERMANENT_HOLD, ""],
+    ids=["temporary_hold", "permanent_hold", "empty"],
+)
+async def test_set_invalid_preset_mode(
+    client: AprilaireClient,
+    climate: AprilaireClimate,
+    preset_mode: str,
+):
+    """Test setting an unsupported climate entity preset mode."""
 
     with pytest.raises(ValueError):
-        await climate.async_set_preset_mode("")
+        await climate.async_set_preset_mode(preset_mode)
 
-    client.set_hold.assert_not_called()
-    client.read_scheduling.assert_not_called()
-    client.reset_mock()
+    assert_calls(client, set_hold=None, read_scheduling=None)
 
 
 async def test_set_humidity(
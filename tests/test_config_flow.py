@@ -2,8 +2,9 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
+import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from pyaprilaire.client import AprilaireClient
@@ -11,35 +12,69 @@ from pyaprilaire.const import Attribute, FunctionalDomain
 
 from custom_components.aprilaire.config_flow import STEP_USER_DATA_SCHEMA, ConfigFlow
 
+_APRILAIRE_CLIENT_PATH = "pyaprilaire.client.AprilaireClient"
+_IDENT_CALL = (FunctionalDomain.IDENTIFICATION, 2, 30)
 
-async def test_user_input_step() -> None:
-    """Test the user input step."""
 
-    show_form_mock = Mock()
+@pytest.fixture
+def config_flow(hass: HomeAssistant) -> ConfigFlow:
+    """Get a config flow with its result methods mocked."""
 
     config_flow = ConfigFlow()
-    config_flow.async_show_form = show_form_mock
+    config_flow.hass = hass
+    config_flow.async_show_form = Mock()
+    config_flow._async_abort_entries_match = Mock()
+    config_flow.async_create_entry = Mock()
 
-    await config_flow.async_step_user(None)
+    return config_flow
 
-    show_form_mock.assert_called_once_with(
-        step_id="user", data_schema=STEP_USER_DATA_SCHEMA
-    )
 
+async def test_user_input_step(config_flow: ConfigFlow) -> None:
+    """Test the user input step."""
 
-async def test_config_flow_invalid_data(client: AprilaireClient) -> None:
-    """Test that the flow is aborted with invalid data."""
+    await config_flow.async_step_user(None)
 
-    show_form_mock = Mock()
-    set_unique_id_mock = AsyncMock()
-    async_abort_entries_match_mock = Mock()
+    config_flow.async_show_form.assert_called_once_with(
+        step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+    )
 
-    config_flow = ConfigFlow()
-    config_flow.async_show_form = show_form_mock
-    config_flow.async_set_unique_id = set_unique_id_mock
-    config_flow._async_abort_entries_match = async_abort_entries_match_mock
 
-    with patch("pyaprilaire.client.AprilaireClient", return_value=client):
+@pytest.mark.parametrize(
+    "identification,expected_wait_calls,expect_entry",
+    [
+        (None, [_IDENT_CALL], False),
+        (
+            {Attribute.MAC_ADDRESS: "test"},
+            [
+                _IDENT_CALL,
+                (FunctionalDomain.IDENTIFICATION, 4, 30),
+                (FunctionalDomain.CONTROL, 7, 30),
+                (FunctionalDomain.SENSORS, 2, 30),
+            ],
+            True,
+        ),
+    ],
+    ids=["invalid", "valid"],
+)
+async def test_config_flow_data(
+    client: AprilaireClient,
+    config_flow: ConfigFlow,
+    identification: dict | None,
+    expected_wait_calls: list,
+    expect_entry: bool,
+) -> None:
+    """Test the config flow with invalid and valid data."""
+
+    wait_for_response_calls = []
+
+    async def wait_for_response(*args):
+        wait_for_response_calls.append(args)
+
+        return identification
+
+    client.wait_for_response = wait_for_response
+
+    with patch(_APRILAIRE_CLIENT_PATH, return_value=client):
         await config_flow.async_step_user(
             {
                 CONF_HOST: "localhost",
@@ -48,62 +83,26 @@ async def test_config_flow_invalid_data(client: AprilaireClient) -> None:
         )
 
     client.start_listen.assert_called_once()
-    client.wait_for_response.assert_called_once_with(
-        FunctionalDomain.IDENTIFICATION, 2, 30
-    )
+    assert wait_for_response_calls == expected_wait_calls
     client.stop_listen.assert_called_once()
 
-    async_abort_entries_match_mock.assert_called_once_with(
+    config_flow._async_abort_entries_match.assert_called_once_with(
         {CONF_HOST: "localhost", CONF_PORT: 7000}
     )
 
-    show_form_mock.assert_called_once_with(
-        step_id="user",
-        data_schema=STEP_USER_DATA_SCHEMA,
-        errors={"base": "connection_failed"},
-    )
-
-
-async def test_config_flow_data(client: AprilaireClient, hass: HomeAssistant) -> None:
-    """Test the config flow with valid data."""
-
-    show_form_mock = Mock()
-    set_unique_id_mock = AsyncMock()
-    async_abort_entries_match_mock = Mock()
-    create_entry_mock = Mock()
-
-    config_flow = ConfigFlow()
-    config_flow.hass = hass
-    config_flow.async_show_form = show_form_mock
-    config_flow.async_set_unique_id = set_unique_id_mock
-    config_flow._async_abort_entries_match = async_abort_entries_match_mock
-    config_flow.async_create_entry = create_entry_mock
-
-    client.wait_for_response = AsyncMock(return_value={Attribute.MAC_ADDRESS: "test"})
-
-    with patch("pyaprilaire.client.AprilaireClient", return_value=client):
-        await config_flow.async_step_user(
-            {
+    if expect_entry:
+        config_flow.async_create_entry.assert_called_once_with(
+            title="Aprilaire",
+            data={
                 CONF_HOST: "localhost",
                 CONF_PORT: 7000,
-            }
+            },
         )
-
-    client.start_listen.assert_called_once()
-    client.wait_for_response.assert_any_call(FunctionalDomain.IDENTIFICATION, 2, 30)
-    client.wait_for_response.assert_any_call(FunctionalDomain.IDENTIFICATION, 4, 30)
-    client.wait_for_response.assert_any_call(FunctionalDomain.CONTROL, 7, 30)
-    client.wait_for_response.assert_any_call(FunctionalDomain.SENSORS, 2, 30)
-    client.stop_listen.assert_called_once()
-
-    async_abort_entries_match_mock.assert_called_once_with(
-        {CONF_HOST: "localhost", CONF_PORT: 7000}
-    )
-
-    create_entry_mock.assert_called_once_with(
-        title="Aprilaire",
-        data={
-            CONF_HOST: "localhost",
-            CONF_PORT: 7000,
-        },
-    )
+        config_flow.async_show_form.assert_not_called()
+    else:
+        config_flow.async_show_form.assert_called_once_with(
+            step_id="user",
+            data_schema=STEP_USER_DATA_SCHEMA,
+            errors={"base": "connection_failed"},
+        )
+        config_flow.async_create_entry.assert_not_called()
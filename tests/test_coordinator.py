@@ -2,6 +2,8 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -13,6 +15,32 @@ from pyaprilaire.const import Attribute, FunctionalDomain
 from custom_components.aprilaire.const import DOMAIN
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 
+# Hardware revisions are reported as ASCII codes for the revision letter
+HW_REV_B = 66  # ord("B")
+HW_REV_C = 67  # ord("C")
+
+DEVICE_PAYLOAD_A = MappingProxyType(
+    {
+        Attribute.MAC_ADDRESS: "1:2:3:4:5:6",
+        Attribute.NAME: "Test Device Name",
+        Attribute.MODEL_NUMBER: 0,
+        Attribute.HARDWARE_REVISION: HW_REV_B,
+        Attribute.FIRMWARE_MAJOR_REVISION: 1,
+        Attribute.FIRMWARE_MINOR_REVISION: 5,
+    }
+)
+
+DEVICE_PAYLOAD_B = MappingProxyType(
+    {
+        Attribute.MAC_ADDRESS: "1:2:3:4:5:7",
+        Attribute.NAME: "Test Device Name 2",
+        Attribute.MODEL_NUMBER: 1,
+        Attribute.HARDWARE_REVISION: HW_REV_C,
+        Attribute.FIRMWARE_MAJOR_REVISION: 2,
+        Attribute.FIRMWARE_MINOR_REVISION: 6,
+    }
+)
+
 
 @pytest.fixture
 def coordinator(client: AprilaireClient, hass: HomeAssistant) -> AprilaireCoordinator:
@@ -24,6 +52,14 @@ def coordinator(client: AprilaireClient, hass: HomeAssistant) -> AprilaireCoordi
         return AprilaireCoordinator(hass, "", 0)
 
 
+@pytest.fixture
+def seeded_coordinator(coordinator: AprilaireCoordinator) -> AprilaireCoordinator:
+    """Return a coordinator that has received the first device payload."""
+    coordinator.async_set_updated_data(DEVICE_PAYLOAD_A)
+
+    return coordinator
+
+
 async def test_start_listen(coordinator: AprilaireCoordinator) -> None:
     """Test that the coordinator starts the client listening."""
 
@@ -65,103 +101,47 @@ def test_device_name(coordinator: AprilaireCoordinator) -> None:
     assert coordinator.device_name == test_device_name
 
 
-def test_device_info(coordinator: AprilaireCoordinator) -> None:
+def test_device_info(seeded_coordinator: AprilaireCoordinator) -> None:
     """Test the device info."""
 
-    test_mac_address = "1:2:3:4:5:6"
-    test_device_name = "Test Device Name"
-    test_model_number = 0
-    test_hardware_revision = ord("B")
-    test_firmware_major_revision = 1
-    test_firmware_minor_revision = 5
-
-    coordinator.async_set_updated_data(
-        {
-            Attribute.MAC_ADDRESS: test_mac_address,
-            Attribute.NAME: test_device_name,
-            Attribute.MODEL_NUMBER: test_model_number,
-            Attribute.HARDWARE_REVISION: test_hardware_revision,
-            Attribute.FIRMWARE_MAJOR_REVISION: test_firmware_major_revision,
-            Attribute.FIRMWARE_MINOR_REVISION: test_firmware_minor_revision,
-        }
-    )
-
-    device_info = coordinator.device_info
-
-    assert device_info["identifiers"] == {(DOMAIN, test_mac_address)}
-    assert device_info["name"] == test_device_name
+    device_info = seeded_coordinator.device_info
+
+    assert device_info["identifiers"] == {(DOMAIN, "1:2:3:4:5:6")}
+    assert device_info["name"] == "Test Device Name"
     assert device_info["model"] == "8476W"
     assert device_info["hw_version"] == "Rev. B"
-    assert (
-        device_info["sw_version"]
-        == f"{test_firmware_major_revision}.{test_firmware_minor_revision:02}"
-    )
-
-
-def test_no_hw_version(coordinator: AprilaireCoordinator) -> None:
-    """Test the hardware version for revision A."""
-    assert coordinator.get_hw_version({}) == "Unknown"
-
-
-def test_hw_version_a(coordinator: AprilaireCoordinator) -> None:
-    """Test the hardware version for revision A."""
-    assert coordinator.get_hw_version({Attribute.HARDWARE_REVISION: 1}) == "1"
-
-
-def test_hw_version_b(coordinator: AprilaireCoordinator) -> None:
-    """Test the hardware version for revision B."""
-    assert (
-        coordinator.get_hw_version({Attribute.HARDWARE_REVISION: ord("B")}) == "Rev. B"
-    )
+    assert device_info["sw_version"] == "1.05"
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({}, "Unknown"),
+        ({Attribute.HARDWARE_REVISION: 1}, "1"),
+        ({Attribute.HARDWARE_REVISION: HW_REV_B}, "Rev. B"),
+    ],
+    ids=["unknown", "a", "b"],
+)
+def test_hw_version(
+    coordinator: AprilaireCoordinator, data: dict[str, Any], expected: str
+) -> None:
+    """Test the hardware version."""
+    assert coordinator.get_hw_version(data) == expected
 
 
 def test_updated_device(
-    coordinator: AprilaireCoordinator, device_registry: DeviceRegistry
+    seeded_coordinator: AprilaireCoordinator, device_registry: DeviceRegistry
 ) -> None:
     """Test updating the device info."""
 
-    test_mac_address = "1:2:3:4:5:6"
-    test_device_name = "Test Device Name"
-    test_model_number = 0
-    test_hardware_revision = ord("B")
-    test_firmware_major_revision = 1
-    test_firmware_minor_revision = 5
-
-    test_new_mac_address = "1:2:3:4:5:7"
-    test_new_device_name = "Test Device Name 2"
-    test_new_model_number = 1
-    test_new_hardware_revision = ord("C")
-    test_new_firmware_major_revision = 2
-    test_new_firmware_minor_revision = 6
-
-    coordinator.async_set_updated_data(
-        {
-            Attribute.MAC_ADDRESS: test_mac_address,
-            Attribute.NAME: test_device_name,
-            Attribute.MODEL_NUMBER: test_model_number,
-            Attribute.HARDWARE_REVISION: test_hardware_revision,
-            Attribute.FIRMWARE_MAJOR_REVISION: test_firmware_major_revision,
-            Attribute.FIRMWARE_MINOR_REVISION: test_firmware_minor_revision,
-        }
-    )
-
-    coordinator.async_set_updated_data(
-        {
-            Attribute.MAC_ADDRESS: test_new_mac_address,
-            Attribute.NAME: test_new_device_name,
-            Attribute.MODEL_NUMBER: test_new_model_number,
-            Attribute.HARDWARE_REVISION: test_new_hardware_revision,
-            Attribute.FIRMWARE_MAJOR_REVISION: test_new_firmware_major_revision,
-            Attribute.FIRMWARE_MINOR_REVISION: test_new_firmware_minor_revision,
-        }
-    )
+    seeded_coordinator.async_set_updated_data(DEVICE_PAYLOAD_B)
 
     assert device_registry.async_update_device.call_count == 1
 
     new_device_info = device_registry.async_update_device.call_args[1]
 
     assert new_device_info == new_device_info | {
-        "name": test_new_device_name,
+        "name": "Test Device Name 2",
         "manufacturer": "Aprilaire",
         "model": "8810",
         "hw_version": "Rev. C",
@@ -187,14 +167,41 @@ async def test_wait_for_ready(coordinator: AprilaireCoordinator) -> None:
 
     ready_callback_mock = AsyncMock()
 
-    wait_for_response_mock = AsyncMock()
-    wait_for_response_mock.return_value = {Attribute.MAC_ADDRESS: "1:2:3:4:5:6"}
+    wait_for_response_calls = []
+
+    async def wait_for_response(*args):
+        wait_for_response_calls.append(args)
 
-    coordinator.client.wait_for_response = wait_for_response_mock
+        return {Attribute.MAC_ADDRESS: "1:2:3:4:5:6"}
+
+    coordinator.client.wait_for_response = wait_for_response
 
     await coordinator.wait_for_ready(ready_callback_mock)
 
-    wait_for_response_mock.assert_any_call(FunctionalDomain.IDENTIFICATION, 2, 30)
-    wait_for_response_mock.assert_any_call(FunctionalDomain.IDENTIFICATION, 4, 30)
-    wait_for_response_mock.assert_any_call(FunctionalDomain.CONTROL, 7, 30)
-    wait_for_response_mock.assert_any_call(FunctionalDomain.SENSORS, 2, 30)
+    assert wait_for_response_calls == [
+        (FunctionalDomain.IDENTIFICATION, 2, 30),
+        (FunctionalDomain.IDENTIFICATION, 4, 30),
+        (FunctionalDomain.CONTROL, 7, 30),
+        (FunctionalDomain.SENSORS, 2, 30),
+    ]
+
+
+def test_updated_data_without_device_info(
+    coordinator: AprilaireCoordinator, device_registry: DeviceRegistry
+) -> None:
+    """Test that device info is not rebuilt for data without device fields."""
+
+    coordinator.async_set_updated_data({Attribute.MAC_ADDRESS: "1:2:3:4:5:6"})
+
+    with patch.object(
+        coordinator, "create_device_info", wraps=coordinator.create_device_info
+    ) as create_device_info_mock:
+        coordinator.async_set_updated_data({Attribute.MODE: 1})
+
+    create_device_info_mock.assert_not_called()
+    device_registry.async_get_device.assert_not_called()
+
+    assert coordinator.data == {
+        Attribute.MAC_ADDRESS: "1:2:3:4:5:6",
+        Attribute.MODE: 1,
+    }
@@ -2,140 +2,134 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-from homeassistant.helpers.entity import DeviceInfo
+import pytest
+from homeassistant.helpers.entity import DeviceInfo, Entity
 from pyaprilaire.const import Attribute
 
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 from custom_components.aprilaire.entity import BaseAprilaireEntity
 
+_EXPECTED_ATTRS = {
+    "device_location": "Test Location",
+    "connected": True,
+    "reconnecting": True,
+    "auto_reconnecting": True,
+}
 
-async def test_available_on_init(coordinator: AprilaireCoordinator) -> None:
-    """Test that the entity becomes available on init."""
 
-    update_available_mock = Mock()
-    with patch(
-        "custom_components.aprilaire.entity.BaseAprilaireEntity._update_available",
-        new=update_available_mock,
-    ):
-        BaseAprilaireEntity(coordinator)
-    update_available_mock.assert_called_once()
+@pytest.fixture
+def entity(coordinator: AprilaireCoordinator) -> BaseAprilaireEntity:
+    """Get a base entity."""
+    return BaseAprilaireEntity(coordinator)
 
 
-async def test_handle_coordinator_update(coordinator: AprilaireCoordinator) -> None:
-    """Test that the coordinator updates the entity."""
+def test_available_on_init(
+    coordinator: AprilaireCoordinator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the entity becomes available on init."""
 
     update_available_mock = Mock()
-    async_write_ha_state_mock = Mock()
+    monkeypatch.setattr(BaseAprilaireEntity, "_update_available", update_available_mock)
 
-    with patch(
-        "custom_components.aprilaire.entity.BaseAprilaireEntity._update_available",
-        new=update_available_mock,
-    ), patch(
-        "homeassistant.helpers.entity.Entity.async_write_ha_state",
-        new=async_write_ha_state_mock,
-    ):
-        entity = BaseAprilaireEntity(coordinator)
-        entity._handle_coordinator_update()
+    BaseAprilaireEntity(coordinator)
 
     update_available_mock.assert_called_once()
-    async_write_ha_state_mock.assert_called_once()
-
-
-async def test_update_available_stopped(coordinator: AprilaireCoordinator) -> None:
-    """Test that the stopped state causes the entity to not be available."""
-
-    entity = BaseAprilaireEntity(coordinator)
-
-    coordinator.data[Attribute.STOPPED] = True
-    entity._update_available()
 
-    assert entity._attr_available is False
-    assert entity.available is False
 
+def test_handle_coordinator_update(
+    coordinator: AprilaireCoordinator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the coordinator updates the entity."""
 
-async def test_update_available_no_mac(coordinator: AprilaireCoordinator) -> None:
-    """Test that no MAC address causes the entity to not be available."""
-
-    entity = BaseAprilaireEntity(coordinator)
-
-    coordinator.data[Attribute.CONNECTED] = True
-    coordinator.data[Attribute.STOPPED] = False
-    coordinator.data[Attribute.MAC_ADDRESS] = None
-    entity._update_available()
-
-    assert entity._attr_available is False
-    assert entity.available is False
-
+    update_available_mock = Mock()
+    async_write_ha_state_mock = Mock()
 
-async def test_update_available_connected_not_stopped(
-    coordinator: AprilaireCoordinator,
-) -> None:
-    """Test that the connected state causes the entity to be available."""
+    monkeypatch.setattr(BaseAprilaireEntity, "_update_available", update_available_mock)
+    monkeypatch.setattr(Entity, "async_write_ha_state", async_write_ha_state_mock)
 
     entity = BaseAprilaireEntity(coordinator)
+    entity._handle_coordinator_update()
 
-    coordinator.data[Attribute.CONNECTED] = True
-    coordinator.data[Attribute.STOPPED] = False
-    coordinator.data[Attribute.MAC_ADDRESS] = "1:2:3:4:5:6"
-    entity._update_available()
-
-    assert entity._attr_available is True
-    assert entity.available is True
+    update_available_mock.assert_called_once()
+    async_write_ha_state_mock.assert_called_once()
 
 
-async def test_update_available_reconnecting_not_stopped(
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({Attribute.STOPPED: True}, False),
+        (
+            {
+                Attribute.CONNECTED: True,
+                Attribute.STOPPED: False,
+                Attribute.MAC_ADDRESS: None,
+            },
+            False,
+        ),
+        (
+            {
+                Attribute.CONNECTED: True,
+                Attribute.STOPPED: False,
+                Attribute.MAC_ADDRESS: "1:2:3:4:5:6",
+            },
+            True,
+        ),
+        (
+            {
+                Attribute.CONNECTED: False,
+                Attribute.RECONNECTING: True,
+                Attribute.STOPPED: False,
+                Attribute.MAC_ADDRESS: "1:2:3:4:5:6",
+            },
+            True,
+        ),
+    ],
+    ids=["stopped", "no_mac", "connected_not_stopped", "reconnecting_not_stopped"],
+)
+def test_update_available(
     coordinator: AprilaireCoordinator,
+    entity: BaseAprilaireEntity,
+    data: dict,
+    expected: bool,
 ) -> None:
-    """Test that the entity remains available when reconnecting."""
-
-    entity = BaseAprilaireEntity(coordinator)
+    """Test the entity availability for the connection states."""
 
-    coordinator.data[Attribute.CONNECTED] = False
-    coordinator.data[Attribute.RECONNECTING] = True
-    coordinator.data[Attribute.STOPPED] = False
-    coordinator.data[Attribute.MAC_ADDRESS] = "1:2:3:4:5:6"
+    coordinator.data.update(data)
     entity._update_available()
 
-    assert entity._attr_available is True
-    assert entity.available is True
+    assert entity.available is expected
 
 
-def test_should_poll(coordinator: AprilaireCoordinator) -> None:
+def test_should_poll(entity: BaseAprilaireEntity) -> None:
     """Test that the entity does not poll."""
 
-    entity = BaseAprilaireEntity(coordinator)
-
     assert entity.should_poll is False
 
 
-def test_unique_id(coordinator: AprilaireCoordinator) -> None:
+def test_unique_id(
+    coordinator: AprilaireCoordinator,
+    entity: BaseAprilaireEntity,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test the generation of the entity's unique ID."""
 
-    entity = BaseAprilaireEntity(coordinator)
-
     coordinator.data[Attribute.MAC_ADDRESS] = "1:2:3:4:5:6"
 
-    with patch(
-        "custom_components.aprilaire.entity.BaseAprilaireEntity.name",
-        new="Test Entity",
-    ):
-        assert entity.unique_id == "1_2_3_4_5_6_test_entity"
+    monkeypatch.setattr(BaseAprilaireEntity, "name", "Test Entity")
+
+    assert entity.unique_id == "1_2_3_4_5_6_test_entity"
 
 
-def test_extra_state_attributes(coordinator: AprilaireCoordinator) -> None:
+def test_extra_state_attributes(
+    coordinator: AprilaireCoordinator, entity: BaseAprilaireEntity
+) -> None:
     """Test the entity's extra state attributes."""
 
-    entity = BaseAprilaireEntity(coordinator)
     coordinator.data[Attribute.LOCATION] = "Test Location"
 
-    assert entity.extra_state_attributes == {
-        "device_location": "Test Location",
-        "connected": True,
-        "reconnecting": True,
-        "auto_reconnecting": True,
-    }
+    assert entity.extra_state_attributes == _EXPECTED_ATTRS
 
 
 def test_device_info(coordinator: AprilaireCoordinator) -> None:
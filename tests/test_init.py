@@ -2,9 +2,11 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
+import logging
 from collections.abc import Awaitable, Callable
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
+import pytest
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from pyaprilaire.client import AprilaireClient
@@ -13,136 +15,119 @@ from custom_components.aprilaire import async_setup_entry, async_unload_entry
 from custom_components.aprilaire.const import DOMAIN
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
 
+LOG_MISSING_MAC = "Missing MAC address, cannot create unique ID"
+LOG_NOT_READY = "Failed to wait for ready"
 
-async def test_async_setup_entry(
-    client: AprilaireClient,
-    config_entry: ConfigEntry,
-    unique_id: str,
-    hass: HomeAssistant,
-) -> None:
-    """Test handling of setup with missing MAC address."""
-
-    with patch(
-        "pyaprilaire.client.AprilaireClient",
-        return_value=client,
-    ):
-        setup_result = await async_setup_entry(hass, config_entry)
-
-    assert setup_result is True
 
-    client.start_listen.assert_called_once()
+def _make_wait_for_ready(ready: bool) -> Callable[..., Awaitable[None]]:
+    """Make a wait_for_ready replacement that reports the given readiness."""
 
-    assert isinstance(hass.data[DOMAIN][unique_id], AprilaireCoordinator)
+    # pylint: disable-next=unused-argument
+    async def wait_for_ready(
+        self, ready_callback: Callable[[bool], Awaitable[None]]
+    ) -> None:
+        await ready_callback(ready)
 
+    return wait_for_ready
 
-async def test_async_setup_entry_ready(
-    client: AprilaireClient,
-    config_entry: ConfigEntry,
-    hass: HomeAssistant,
-) -> None:
-    """Test setup entry with valid data."""
 
-    # pylint: disable=unused-argument
-    async def wait_for_ready(self, ready_callback: Callable[[bool], Awaitable[None]]):
-        await ready_callback(True)
+@pytest.fixture(autouse=True)
+def _patch_client(client: AprilaireClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the coordinator create the test client."""
+    monkeypatch.setattr("pyaprilaire.client.AprilaireClient", Mock(return_value=client))
 
-    with patch(
-        "pyaprilaire.client.AprilaireClient",
-        return_value=client,
-    ), patch(
-        "custom_components.aprilaire.coordinator.AprilaireCoordinator.wait_for_ready",
-        new=wait_for_ready,
-    ):
-        setup_result = await async_setup_entry(hass, config_entry)
-
-    assert setup_result is True
 
-
-async def test_async_setup_entry_not_ready(
+async def test_async_setup_entry(
+    caplog: pytest.LogCaptureFixture,
     client: AprilaireClient,
     config_entry: ConfigEntry,
+    unique_id: str,
     hass: HomeAssistant,
 ) -> None:
-    """Test handling of setup when client is not ready."""
+    """Test handling of setup with missing MAC address."""
 
-    # pylint: disable=unused-argument
-    async def wait_for_ready(self, ready_callback: Callable[[bool], Awaitable[None]]):
-        await ready_callback(False)
+    caplog.set_level(logging.ERROR)
 
-    with patch(
-        "pyaprilaire.client.AprilaireClient",
-        return_value=client,
-    ), patch(
-        "custom_components.aprilaire.coordinator.AprilaireCoordinator.wait_for_ready",
-        new=wait_for_ready,
-    ):
-        setup_result = await async_setup_entry(hass, config_entry)
+    setup_result = await async_setup_entry(hass, config_entry)
 
     assert setup_result is True
 
-    client.stop_listen.assert_called_once()
+    client.start_listen.assert_called_once()
 
+    assert isinstance(hass.data[DOMAIN][unique_id], AprilaireCoordinator)
 
-async def test_unload_entry_ok(
+    assert [record.message for record in caplog.records] == [
+        LOG_MISSING_MAC,
+        LOG_NOT_READY,
+    ]
+
+
+@pytest.mark.parametrize(
+    "ready,stop_listen_calls,expected_messages",
+    [
+        (True, 0, []),
+        (False, 1, [LOG_NOT_READY]),
+    ],
+    ids=["ready", "not_ready"],
+)
+async def test_async_setup_entry_wait_for_ready(
+    caplog: pytest.LogCaptureFixture,
     client: AprilaireClient,
     config_entry: ConfigEntry,
     hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    ready: bool,
+    stop_listen_calls: int,
+    expected_messages: list[str],
 ) -> None:
-    """Test unloading the config entry."""
+    """Test setup entry when the client does or does not become ready."""
 
-    # pylint: disable=unused-argument
-    async def wait_for_ready(self, ready_callback: Callable[[bool], Awaitable[None]]):
-        await ready_callback(True)
+    caplog.set_level(logging.ERROR)
 
-    stop_listen_mock = Mock()
+    monkeypatch.setattr(
+        AprilaireCoordinator, "wait_for_ready", _make_wait_for_ready(ready)
+    )
 
-    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    setup_result = await async_setup_entry(hass, config_entry)
 
-    with patch(
-        "pyaprilaire.client.AprilaireClient",
-        return_value=client,
-    ), patch(
-        "custom_components.aprilaire.coordinator.AprilaireCoordinator.wait_for_ready",
-        new=wait_for_ready,
-    ), patch(
-        "custom_components.aprilaire.coordinator.AprilaireCoordinator.stop_listen",
-        new=stop_listen_mock,
-    ):
-        await async_setup_entry(hass, config_entry)
+    assert setup_result is True
 
-        unload_result = await async_unload_entry(hass, config_entry)
+    assert client.stop_listen.call_count == stop_listen_calls
+
+    assert [record.message for record in caplog.records] == expected_messages
 
-    hass.config_entries.async_unload_platforms.assert_called_once()
 
-    assert unload_result is True
+@pytest.fixture
+async def _set_up_entry(
+    config_entry: ConfigEntry, hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Set up the config entry with a ready client."""
+    monkeypatch.setattr(
+        AprilaireCoordinator, "wait_for_ready", _make_wait_for_ready(True)
+    )
 
-    stop_listen_mock.assert_called_once()
+    await async_setup_entry(hass, config_entry)
 
 
-async def test_unload_entry_not_ok(
-    client: AprilaireClient,
+@pytest.mark.usefixtures("_set_up_entry")
+@pytest.mark.parametrize("unload_ok", [True, False], ids=["ok", "not_ok"])
+async def test_unload_entry(
     config_entry: ConfigEntry,
     hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    unload_ok: bool,
 ) -> None:
-    """Test handling of unload failure."""
-
-    # pylint: disable=unused-argument
-    async def wait_for_ready(self, ready_callback: Callable[[bool], Awaitable[None]]):
-        await ready_callback(True)
+    """Test unloading the config entry."""
 
-    with patch(
-        "pyaprilaire.client.AprilaireClient",
-        return_value=client,
-    ), patch(
-        "custom_components.aprilaire.coordinator.AprilaireCoordinator.wait_for_ready",
-        new=wait_for_ready,
-    ):
-        await async_setup_entry(hass, config_entry)
+    stop_listen_mock = Mock()
+    monkeypatch.setattr(AprilaireCoordinator, "stop_listen", stop_listen_mock)
 
-    hass.config_entries.async_unload_platforms = AsyncMock(return_value=False)
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=unload_ok)
 
     unload_result = await async_unload_entry(hass, config_entry)
 
     hass.config_entries.async_unload_platforms.assert_called_once()
 
-    assert unload_result is False
+    assert unload_result is unload_ok
+
+    assert stop_listen_mock.call_count == (1 if unload_ok else 0)
@@ -2,13 +2,24 @@
 
 # pylint: disable=protected-access,redefined-outer-name
 
-from unittest.mock import Mock
-
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, TEMP_CELSIUS, TEMP_FAHRENHEIT
 from homeassistant.core import HomeAssistant
-from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
+from homeassistant.util.unit_system import (
+    METRIC_SYSTEM,
+    US_CUSTOMARY_SYSTEM,
+    UnitSystem,
+)
 from pyaprilaire.const import Attribute
 
 from custom_components.aprilaire.coordinator import AprilaireCoordinator
@@ -23,256 +34,279 @@ from custom_components.aprilaire.sensor import (
     AprilaireVentilationStatusSensor,
     BaseAprilaireTemperatureSensor,
     async_setup_entry,
+    build_sensors,
 )
 
-
-async def test_no_sensors_without_data(config_entry: ConfigEntry, hass: HomeAssistant):
+from .common import FakeAddEntities
+
+MakeSensor = Callable[..., SensorEntity]
+
+SENSOR_DISCOVERY_CASES = {
+    "indoor_humidity": (
+        MappingProxyType({Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS: 0}),
+        AprilaireIndoorHumidityControllingSensor,
+    ),
+    "outdoor_humidity": (
+        MappingProxyType({Attribute.OUTDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS: 0}),
+        AprilaireOutdoorHumidityControllingSensor,
+    ),
+    "indoor_temperature": (
+        MappingProxyType({Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0}),
+        AprilaireIndoorTemperatureControllingSensor,
+    ),
+    "outdoor_temperature": (
+        MappingProxyType({Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0}),
+        AprilaireOutdoorTemperatureControllingSensor,
+    ),
+    "dehumidification": (
+        MappingProxyType({Attribute.DEHUMIDIFICATION_AVAILABLE: 1}),
+        AprilaireDehumidificationStatusSensor,
+    ),
+    "humidification": (
+        MappingProxyType({Attribute.HUMIDIFICATION_AVAILABLE: 1}),
+        AprilaireHumidificationStatusSensor,
+    ),
+    "ventilation": (
+        MappingProxyType({Attribute.VENTILATION_AVAILABLE: 1}),
+        AprilaireVentilationStatusSensor,
+    ),
+    "air_cleaning": (
+        MappingProxyType({Attribute.AIR_CLEANING_AVAILABLE: 1}),
+        AprilaireAirCleaningStatusSensor,
+    ),
+}
+
+DEHUMIDIFICATION_STATUSES = {
+    0: "Idle",
+    1: "Idle",
+    2: "On",
+    3: "On",
+    4: "Off",
+    5: None,
+}
+
+HUMIDIFICATION_STATUSES = {
+    0: "Idle",
+    1: "Idle",
+    2: "On",
+    3: "Off",
+    4: None,
+}
+
+VENTILATION_STATUSES = {
+    0: "Idle",
+    1: "Idle",
+    2: "On",
+    3: "Idle",
+    4: "Idle",
+    5: "Idle",
+    6: "Off",
+    7: None,
+}
+
+AIR_CLEANING_STATUSES = {
+    0: "Idle",
+    1: "Idle",
+    2: "On",
+    3: "Off",
+    4: None,
+}
+
+
+@pytest.fixture
+def make_sensor(coordinator: AprilaireCoordinator) -> MakeSensor:
+    """Get a factory for available sensors bound to the coordinator."""
+
+    def _make_sensor(
+        sensor_class: type[SensorEntity], **attributes: Any
+    ) -> SensorEntity:
+        sensor = sensor_class(coordinator)
+        sensor._attr_available = True
+
+        for name, value in attributes.items():
+            setattr(sensor, name, value)
+
+        return sensor
+
+    return _make_sensor
+
+
+async def test_no_sensors_without_data(
+    add_entities: FakeAddEntities, config_entry: ConfigEntry, hass: HomeAssistant
+):
     """Test that there are no sensors when there is no data."""
 
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
+    await async_setup_entry(hass, config_entry, add_entities)
 
-    async_add_entities_mock.assert_called_once_with([])
+    assert add_entities.calls == [[]]
 
 
-def test_temperature_sensor_unit_of_measurement_sensor_option(
+@pytest.mark.parametrize(
+    "data,sensor_class",
+    SENSOR_DISCOVERY_CASES.values(),
+    ids=SENSOR_DISCOVERY_CASES.keys(),
+)
+def test_build_sensors(
     coordinator: AprilaireCoordinator,
-    hass: HomeAssistant,
+    data: Mapping[str, Any],
+    sensor_class: type[SensorEntity],
 ):
-    """Test the base temperature sensor's unit of measurement."""
+    """Test that the matching sensor is built for the coordinator's data."""
 
-    base_sensor = BaseAprilaireTemperatureSensor(coordinator)
-    base_sensor.hass = hass
+    coordinator.data = data
 
-    base_sensor._sensor_option_unit_of_measurement = TEMP_CELSIUS
-    assert base_sensor.unit_of_measurement == TEMP_CELSIUS
+    sensors = build_sensors(coordinator)
 
-    base_sensor._sensor_option_unit_of_measurement = TEMP_FAHRENHEIT
-    assert base_sensor.unit_of_measurement == TEMP_FAHRENHEIT
+    assert len(sensors) == 1
+    assert isinstance(sensors[0], sensor_class)
 
 
-def test_base_temperature_sensor_value(
+@pytest.mark.parametrize("unit", [TEMP_CELSIUS, TEMP_FAHRENHEIT])
+def test_temperature_sensor_unit_of_measurement_sensor_option(
     coordinator: AprilaireCoordinator,
     hass: HomeAssistant,
+    unit: str,
 ):
-    """Test the base temperature sensor's value"""
+    """Test the base temperature sensor's unit of measurement."""
+
     base_sensor = BaseAprilaireTemperatureSensor(coordinator)
     base_sensor.hass = hass
-    hass.config.units = METRIC_SYSTEM
+    base_sensor._sensor_option_unit_of_measurement = unit
 
-    assert base_sensor.native_value is None
+    assert base_sensor.unit_of_measurement == unit
 
 
-def test_base_temperature_sensor_display_precision(
+@pytest.mark.parametrize(
+    "units,precision",
+    [(METRIC_SYSTEM, 1), (US_CUSTOMARY_SYSTEM, 0)],
+    ids=["metric", "us_customary"],
+)
+def test_base_temperature_sensor(
     coordinator: AprilaireCoordinator,
     hass: HomeAssistant,
+    units: UnitSystem,
+    precision: int,
 ):
-    """Test the base temperature sensor's display precision."""
+    """Test the base temperature sensor's value and display precision."""
 
     base_sensor = BaseAprilaireTemperatureSensor(coordinator)
     base_sensor.hass = hass
+    hass.config.units = units
 
-    hass.config.units = METRIC_SYSTEM
-    assert base_sensor.suggested_display_precision == 1
-
-    hass.config.units = US_CUSTOMARY_SYSTEM
-    assert base_sensor.suggested_display_precision == 0
-
-
-async def test_indoor_humidity_controlling_sensor(
-    config_entry: ConfigEntry,
-    coordinator: AprilaireCoordinator,
-    hass: HomeAssistant,
-):
-    """Test the indoor humidity controlling sensor."""
-
-    test_value = 50
-
-    coordinator.data = {
-        Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE: test_value,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireIndoorHumidityControllingSensor)
-
-    sensor._attr_available = True
-
-    assert sensor.device_class == SensorDeviceClass.HUMIDITY
-    assert sensor.state_class == SensorStateClass.MEASUREMENT
-    assert sensor.native_unit_of_measurement == PERCENTAGE
-    assert sensor.available is True
-    assert sensor.native_value == test_value
-    assert sensor.extra_state_attributes["status"] == 0
-    assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
-
-
-async def test_outdoor_humidity_controlling_sensor(
-    config_entry: ConfigEntry,
-    coordinator: AprilaireCoordinator,
-    hass: HomeAssistant,
-):
-    """Test the outdoor humidity controlling sensor."""
-
-    test_value = 50
-
-    coordinator.data = {
-        Attribute.OUTDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.OUTDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE: test_value,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireOutdoorHumidityControllingSensor)
-
-    sensor._attr_available = True
-
-    assert sensor.device_class == SensorDeviceClass.HUMIDITY
-    assert sensor.state_class == SensorStateClass.MEASUREMENT
-    assert sensor.native_unit_of_measurement == PERCENTAGE
-    assert sensor.available is True
-    assert sensor.native_value == test_value
-    assert sensor.extra_state_attributes["status"] == 0
-    assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
-
-
-async def test_indoor_temperature_controlling_sensor(
-    config_entry: ConfigEntry,
+    assert base_sensor.native_value is None
+    assert base_sensor.suggested_display_precision == precision
+
+
+@pytest.mark.parametrize(
+    "sensor_class,status_attribute,value_attribute,test_value,unit,device_class",
+    [
+        (
+            AprilaireIndoorHumidityControllingSensor,
+            Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS,
+            Attribute.INDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE,
+            50,
+            PERCENTAGE,
+            SensorDeviceClass.HUMIDITY,
+        ),
+        (
+            AprilaireOutdoorHumidityControllingSensor,
+            Attribute.OUTDOOR_HUMIDITY_CONTROLLING_SENSOR_STATUS,
+            Attribute.OUTDOOR_HUMIDITY_CONTROLLING_SENSOR_VALUE,
+            50,
+            PERCENTAGE,
+            SensorDeviceClass.HUMIDITY,
+        ),
+        (
+            AprilaireIndoorTemperatureControllingSensor,
+            Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS,
+            Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE,
+            25,
+            TEMP_CELSIUS,
+            SensorDeviceClass.TEMPERATURE,
+        ),
+        (
+            AprilaireOutdoorTemperatureControllingSensor,
+            Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS,
+            Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE,
+            25,
+            TEMP_CELSIUS,
+            SensorDeviceClass.TEMPERATURE,
+        ),
+    ],
+    ids=[
+        "indoor_humidity",
+        "outdoor_humidity",
+        "indoor_temperature",
+        "outdoor_temperature",
+    ],
+)
+def test_controlling_sensor(
     coordinator: AprilaireCoordinator,
     hass: HomeAssistant,
+    make_sensor: MakeSensor,
+    sensor_class: type[SensorEntity],
+    status_attribute: str,
+    value_attribute: str,
+    test_value: int,
+    unit: str,
+    device_class: SensorDeviceClass,
 ):
-    """Test the indoor temperature controlling sensor."""
-
-    test_value = 25
+    """Test the controlling sensors."""
 
     coordinator.data = {
-        Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: test_value,
+        status_attribute: 0,
+        value_attribute: test_value,
     }
 
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
+    sensor = make_sensor(sensor_class, hass=hass)
 
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-    sensor.hass = hass
-
-    assert isinstance(sensor, AprilaireIndoorTemperatureControllingSensor)
-
-    sensor._attr_available = True
-
-    assert sensor.device_class == SensorDeviceClass.TEMPERATURE
+    assert sensor.device_class == device_class
     assert sensor.state_class == SensorStateClass.MEASUREMENT
-    assert sensor.native_unit_of_measurement == TEMP_CELSIUS
+    assert sensor.native_unit_of_measurement == unit
     assert sensor.available is True
     assert sensor.native_value == test_value
     assert sensor.extra_state_attributes["status"] == 0
     assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
 
 
-async def test_outdoor_temperature_controlling_sensor(
-    config_entry: ConfigEntry,
-    coordinator: AprilaireCoordinator,
-    hass: HomeAssistant,
-):
-    """Test the outdoor temperature controlling sensor."""
-
-    test_value = 25
-
-    coordinator.data = {
-        Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: test_value,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-    sensor.hass = hass
-
-    assert isinstance(sensor, AprilaireOutdoorTemperatureControllingSensor)
-
-    sensor._attr_available = True
-
-    assert sensor.device_class == SensorDeviceClass.TEMPERATURE
-    assert sensor.state_class == SensorStateClass.MEASUREMENT
-    assert sensor.native_unit_of_measurement == TEMP_CELSIUS
-    assert sensor.available is True
-    assert sensor.native_value == test_value
-    assert sensor.extra_state_attributes["status"] == 0
-    assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
-
-
-def test_indoor_temperature_controlling_sensor_fahrenheit(
+@pytest.mark.parametrize(
+    "sensor_class,status_attribute,value_attribute",
+    [
+        (
+            AprilaireIndoorTemperatureControllingSensor,
+            Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS,
+            Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE,
+        ),
+        (
+            AprilaireOutdoorTemperatureControllingSensor,
+            Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS,
+            Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE,
+        ),
+    ],
+    ids=["indoor", "outdoor"],
+)
+def test_temperature_controlling_sensor_fahrenheit(
     coordinator: AprilaireCoordinator,
     hass: HomeAssistant,
+    make_sensor: MakeSensor,
+    sensor_class: type[BaseAprilaireTemperatureSensor],
+    status_attribute: str,
+    value_attribute: str,
 ):
-    """Test the indoor temperature controlling sensor in fahrenheit."""
-
-    test_value = 25
-
-    coordinator.data = {
-        Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.INDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: test_value,
-    }
-
-    sensor = AprilaireIndoorTemperatureControllingSensor(coordinator)
-    sensor._attr_available = True
-    sensor._sensor_option_unit_of_measurement = TEMP_FAHRENHEIT
-    sensor.hass = hass
-
-    assert sensor.device_class == SensorDeviceClass.TEMPERATURE
-    assert sensor.state_class == SensorStateClass.MEASUREMENT
-    assert sensor.unit_of_measurement == TEMP_FAHRENHEIT
-    assert sensor.available is True
-    assert sensor.native_value == 25
-    assert sensor.extra_state_attributes["status"] == 0
-    assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
-
-
-def test_outdoor_temperature_controlling_sensor_fahrenheit(
-    coordinator: AprilaireCoordinator, hass: HomeAssistant
-):
-    """Test the outdoor temperature controlling sensor in fahrenheit."""
+    """Test the temperature controlling sensors in fahrenheit."""
 
     test_value = 25
 
     coordinator.data = {
-        Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_STATUS: 0,
-        Attribute.OUTDOOR_TEMPERATURE_CONTROLLING_SENSOR_VALUE: test_value,
+        status_attribute: 0,
+        value_attribute: test_value,
     }
 
-    sensor = AprilaireOutdoorTemperatureControllingSensor(coordinator)
-    sensor._attr_available = True
-    sensor._sensor_option_unit_of_measurement = TEMP_FAHRENHEIT
-    sensor.hass = hass
+    sensor = make_sensor(
+        sensor_class,
+        _sensor_option_unit_of_measurement=TEMP_FAHRENHEIT,
+        hass=hass,
+    )
 
     assert sensor.device_class == SensorDeviceClass.TEMPERATURE
     assert sensor.state_class == SensorStateClass.MEASUREMENT
@@ -283,475 +317,77 @@ def test_outdoor_temperature_controlling_sensor_fahrenheit(
     assert sensor.extra_state_attributes["raw_sensor_value"] == test_value
 
 
-async def test_dehumidification_available(
-    config_entry: ConfigEntry, coordinator: AprilaireCoordinator, hass: HomeAssistant
-):
-    """Test the dehumidification status sensor."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_AVAILABLE: 1,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireDehumidificationStatusSensor)
-
-
-def test_dehumidification_status_sensor_0(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the dehumidification status sensor with status 0."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 0,
-    }
-
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_dehumidification_status_sensor_1(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the dehumidification status sensor with status 1."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 1,
-    }
-
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_dehumidification_status_sensor_2(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the dehumidification status sensor with status 2."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 2,
-    }
-
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "On"
-
-
-def test_dehumidification_status_sensor_3(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the dehumidification status sensor with status 3."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 3,
-    }
-
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "On"
-
-
-def test_dehumidification_status_sensor_4(
+@pytest.mark.parametrize("status,expected", DEHUMIDIFICATION_STATUSES.items())
+def test_dehumidification_status_sensor(
     coordinator: AprilaireCoordinator,
+    make_sensor: MakeSensor,
+    status: int,
+    expected: str | None,
 ):
-    """Test the dehumidification status sensor with status 4."""
+    """Test the dehumidification status sensor."""
 
     coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 4,
+        Attribute.DEHUMIDIFICATION_STATUS: status,
     }
 
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
+    sensor = make_sensor(AprilaireDehumidificationStatusSensor)
 
     assert sensor.available is True
-    assert sensor.native_value == "Off"
+    assert sensor.native_value == expected
 
 
-def test_dehumidification_status_sensor_5(
+@pytest.mark.parametrize("status,expected", HUMIDIFICATION_STATUSES.items())
+def test_humidification_status_sensor(
     coordinator: AprilaireCoordinator,
-):
-    """Test the dehumidification status sensor with status 5."""
-
-    coordinator.data = {
-        Attribute.DEHUMIDIFICATION_STATUS: 5,
-    }
-
-    sensor = AprilaireDehumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value is None
-
-
-async def test_humidification_available(
-    config_entry: ConfigEntry, coordinator: AprilaireCoordinator, hass: HomeAssistant
+    make_sensor: MakeSensor,
+    status: int,
+    expected: str | None,
 ):
     """Test the humidification status sensor."""
 
     coordinator.data = {
-        Attribute.HUMIDIFICATION_AVAILABLE: 1,
+        Attribute.HUMIDIFICATION_STATUS: status,
     }
 
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireHumidificationStatusSensor)
-
-
-def test_humidification_status_sensor_0(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the humidification status sensor with status 0."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_STATUS: 0,
-    }
-
-    sensor = AprilaireHumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_humidification_status_sensor_1(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the humidification status sensor with status 1."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_STATUS: 1,
-    }
-
-    sensor = AprilaireHumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_humidification_status_sensor_2(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the humidification status sensor with status 2."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_STATUS: 2,
-    }
-
-    sensor = AprilaireHumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
+    sensor = make_sensor(AprilaireHumidificationStatusSensor)
 
     assert sensor.available is True
-    assert sensor.native_value == "On"
+    assert sensor.native_value == expected
 
 
-def test_humidification_status_sensor_3(
+@pytest.mark.parametrize("status,expected", VENTILATION_STATUSES.items())
+def test_ventilation_status_sensor(
     coordinator: AprilaireCoordinator,
-):
-    """Test the humidification status sensor with status 3."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_STATUS: 3,
-    }
-
-    sensor = AprilaireHumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Off"
-
-
-def test_humidification_status_sensor_4(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the humidification status sensor with status 4."""
-
-    coordinator.data = {
-        Attribute.HUMIDIFICATION_STATUS: 4,
-    }
-
-    sensor = AprilaireHumidificationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value is None
-
-
-async def test_ventilation_available(
-    config_entry: ConfigEntry, coordinator: AprilaireCoordinator, hass: HomeAssistant
+    make_sensor: MakeSensor,
+    status: int,
+    expected: str | None,
 ):
     """Test the ventilation status sensor."""
 
     coordinator.data = {
-        Attribute.VENTILATION_AVAILABLE: 1,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireVentilationStatusSensor)
-
-
-def test_ventilation_status_sensor_0(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 0."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 0,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_ventilation_status_sensor_1(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 1."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 1,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_ventilation_status_sensor_2(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 2."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 2,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "On"
-
-
-def test_ventilation_status_sensor_3(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 3."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 3,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_ventilation_status_sensor_4(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 4."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 4,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_ventilation_status_sensor_5(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 5."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 5,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_ventilation_status_sensor_6(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 6."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 6,
+        Attribute.VENTILATION_STATUS: status,
     }
 
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
+    sensor = make_sensor(AprilaireVentilationStatusSensor)
 
     assert sensor.available is True
-    assert sensor.native_value == "Off"
+    assert sensor.native_value == expected
 
 
-def test_ventilation_status_sensor_7(
+@pytest.mark.parametrize("status,expected", AIR_CLEANING_STATUSES.items())
+def test_air_cleaning_status_sensor(
     coordinator: AprilaireCoordinator,
-):
-    """Test the ventilation status sensor with status 7."""
-
-    coordinator.data = {
-        Attribute.VENTILATION_STATUS: 7,
-    }
-
-    sensor = AprilaireVentilationStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value is None
-
-
-async def test_air_cleaning_available(
-    config_entry: ConfigEntry,
-    coordinator: AprilaireCoordinator,
-    hass: HomeAssistant,
+    make_sensor: MakeSensor,
+    status: int,
+    expected: str | None,
 ):
     """Test the air cleaning status sensor."""
 
     coordinator.data = {
-        Attribute.AIR_CLEANING_AVAILABLE: 1,
-    }
-
-    async_add_entities_mock = Mock()
-
-    await async_setup_entry(hass, config_entry, async_add_entities_mock)
-
-    sensors_list = async_add_entities_mock.call_args_list[0][0]
-
-    assert len(sensors_list) == 1
-
-    sensor = sensors_list[0][0]
-
-    assert isinstance(sensor, AprilaireAirCleaningStatusSensor)
-
-
-def test_air_cleaning_status_sensor_0(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the air cleaning status sensor with status 0."""
-
-    coordinator.data = {
-        Attribute.AIR_CLEANING_STATUS: 0,
-    }
-
-    sensor = AprilaireAirCleaningStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_air_cleaning_status_sensor_1(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the air cleaning status sensor with status 1."""
-
-    coordinator.data = {
-        Attribute.AIR_CLEANING_STATUS: 1,
-    }
-
-    sensor = AprilaireAirCleaningStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Idle"
-
-
-def test_air_cleaning_status_sensor_2(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the air cleaning status sensor with status 2."""
-
-    coordinator.data = {
-        Attribute.AIR_CLEANING_STATUS: 2,
-    }
-
-    sensor = AprilaireAirCleaningStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "On"
-
-
-def test_air_cleaning_status_sensor_3(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the air cleaning status sensor with status 3."""
-
-    coordinator.data = {
-        Attribute.AIR_CLEANING_STATUS: 3,
-    }
-
-    sensor = AprilaireAirCleaningStatusSensor(coordinator)
-    sensor._attr_available = True
-
-    assert sensor.available is True
-    assert sensor.native_value == "Off"
-
-
-def test_air_cleaning_status_sensor_4(
-    coordinator: AprilaireCoordinator,
-):
-    """Test the air cleaning status sensor with status 4."""
-
-    coordinator.data = {
-        Attribute.AIR_CLEANING_STATUS: 4,
+        Attribute.AIR_CLEANING_STATUS: status,
     }
 
-    sensor = AprilaireAirCleaningStatusSensor(coordinator)
-    sensor._attr_available = True
+    sensor = make_sensor(AprilaireAirCleaningStatusSensor)
 
     assert sensor.available is True
-    assert sensor.native_value is None
+    assert sensor.native_value == expected